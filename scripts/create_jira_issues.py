@@ -3,7 +3,10 @@
 Create Jira issues for Beyond Burndown E2E testing tasks.
 
 Usage:
-    python create_jira_issues.py
+    python create_jira_issues.py [--api-version {2,3}]
+
+REST API v3 (the default) sends descriptions as Atlassian Document Format;
+--api-version 2 sends them as plain text.
 
 Environment variables required:
     JIRA_URL - Your Jira instance URL (e.g., https://yoursite.atlassian.net)
@@ -20,231 +23,422 @@ Example:
 import os
 import sys
 import json
+import time
 import base64
-from urllib import request, error
+import argparse
+import hashlib
+import threading
+import http.client
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+
+    def _load(fp):
+        return orjson.loads(fp.read())
+except ImportError:  # orjson is optional; the stdlib encoder works, just slower
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _load = json.load
 
 # Configuration
 PROJECT_KEY = "BB"  # Change this to your project key
+MAX_CONCURRENCY = 8  # Parallel requests in flight, kept low for Jira rate limits
+MAX_ATTEMPTS = 5  # Tries per request when Jira answers 429 or 5xx
+MAX_BACKOFF_SECONDS = 16
+REQUEST_TIMEOUT_SECONDS = 30
+MAX_ERROR_BYTES = 4096  # Enough of an error body to explain it, without huge HTML pages
+MAX_FAILURES_SHOWN = 20  # Failed summaries repeated in the final summary
+BULK_LIMIT = 50  # Jira accepts at most 50 issues per bulk create request
+PROJECT_CHECK_CACHE = Path.home() / ".cache" / "beyond-burndown" / "project_check.json"
+PROJECT_CHECK_TTL_SECONDS = 3600
 
-# Issues to create
-ISSUES = [
-    {
-        "summary": "Set up Playwright E2E testing infrastructure",
-        "description": """h2. Summary
-Set up end-to-end testing infrastructure using Playwright to test the Beyond Burndown gadget UI.
-
-h2. Background
-We need E2E tests to verify the gadget functionality works correctly across browsers and simulates real user interactions. Unit tests are in place (440 total), but we need integration/E2E tests for complete coverage.
-
-h2. Completed Work
-* Installed Playwright and configured for multi-browser testing
-* Created initial E2E test suite in e2e/gadget.spec.js
-* Created mock data helpers in e2e/fixtures/forge-mock.js
-* Added npm scripts for running tests
-
-h2. Test Coverage
-* Gadget loading states (loading, error, success)
-* Tab navigation (all 7 tabs)
-* Summary bar display
-* What-If panel functionality
-* Export menu
-* Feasibility chart
-* Accessibility checks
-
-h2. How to Run
-{code:bash}
-npm run test:e2e        # Run all tests
-npm run test:e2e:ui     # Interactive UI mode
-npm run test:e2e:headed # Visible browser
-npm run test:e2e:report # View report
-{code}""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "playwright"]
-    },
-    {
-        "summary": "Set up Forge bridge mocking for E2E tests",
-        "description": """h2. Summary
-Implement proper Forge bridge mocking so E2E tests can run without a live Jira connection.
-
-h2. Requirements
-* Mock @forge/bridge invoke() function
-* Mock view.getContext() for edit/view mode detection
-* Mock view.submit() and view.close() for config panel
-* Support different mock data scenarios
-
-h2. Acceptance Criteria
-* E2E tests run successfully without Jira connection
-* Can simulate different data states (loading, error, empty, full data)
-* Mock data is realistic and covers edge cases""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "mocking"]
-    },
-    {
-        "summary": "Add CI/CD pipeline integration for E2E tests",
-        "description": """h2. Summary
-Integrate Playwright E2E tests into the CI/CD pipeline.
-
-h2. Requirements
-* Run E2E tests on pull requests
-* Run E2E tests before deployment
-* Generate and archive test reports
-* Fail build on test failures
-
-h2. Tasks
-* Create GitHub Actions workflow for E2E tests
-* Configure Playwright for CI environment
-* Set up artifact storage for test reports
-* Add status badges to README
-
-h2. Acceptance Criteria
-* E2E tests run automatically on PRs
-* Test results are visible in PR checks
-* Reports are accessible for debugging failures""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "ci-cd", "github-actions"]
-    },
-    {
-        "summary": "Create Jira integration E2E tests",
-        "description": """h2. Summary
-Create E2E tests that verify the gadget works correctly when integrated with Jira.
-
-h2. Test Scenarios
-* Gadget loads correctly on Jira dashboard
-* JQL queries return expected data
-* Config panel saves settings correctly
-* Data refreshes when issues change
-* Edit mode vs view mode behavior
-
-h2. Requirements
-* Test against a dedicated test Jira project
-* Use realistic test data
-* Test error handling (invalid JQL, permissions, etc.)
-
-h2. Acceptance Criteria
-* Tests cover main Jira integration flows
-* Tests are stable and not flaky
-* Can run against staging environment""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "jira-integration"]
-    },
-    {
-        "summary": "Add visual regression testing",
-        "description": """h2. Summary
-Implement visual regression testing to catch unintended UI changes.
-
-h2. Requirements
-* Capture baseline screenshots for all views
-* Compare against baselines on each test run
-* Highlight visual differences
-* Easy baseline update workflow
-
-h2. Views to Test
-* Feasibility chart (daily, weekly, monthly views)
-* What-If panel (all scenario types)
-* Compliance panel (with and without violations)
-* Dependencies view (with and without cycles)
-* Team health view
-* Status report
-* Config panel
-
-h2. Acceptance Criteria
-* Visual tests catch CSS/layout regressions
-* False positives are minimized
-* Baseline updates are easy to review and approve""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "visual-regression"]
-    },
-    {
-        "summary": "Add mobile and tablet viewport E2E tests",
-        "description": """h2. Summary
-Add E2E tests for different viewport sizes to ensure responsive design works correctly.
-
-h2. Viewports to Test
-* Mobile (375x667 - iPhone SE)
-* Mobile Large (414x896 - iPhone 11)
-* Tablet (768x1024 - iPad)
-* Desktop (1280x720)
-* Desktop Large (1920x1080)
-
-h2. Requirements
-* Test main flows on each viewport
-* Verify responsive breakpoints work correctly
-* Check touch interactions on mobile viewports
-
-h2. Acceptance Criteria
-* All viewports pass E2E tests
-* No horizontal scrolling on mobile
-* Touch targets are appropriately sized""",
-        "issuetype": "Task",
-        "labels": ["testing", "e2e", "responsive", "mobile"]
-    }
-]
+# Static request headers, built once; the Authorization header is added per call
+_GET_HEADERS = {"Accept": "application/json"}
+_POST_HEADERS = {**_GET_HEADERS, "Content-Type": "application/json"}
+
+# Issues to create, loaded from issues.json next to this script
+ISSUES_FILE = Path(__file__).parent / "issues.json"
 
 
+@lru_cache(maxsize=1)
+def load_issues() -> list:
+    """Load the issues to create from ISSUES_FILE."""
+    return json.loads(ISSUES_FILE.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=4)
 def get_auth_header(email: str, api_token: str) -> str:
     """Create Basic auth header for Jira API."""
-    credentials = f"{email}:{api_token}"
-    encoded = base64.b64encode(credentials.encode()).decode()
-    return f"Basic {encoded}"
-
-
-def create_issue(jira_url: str, auth_header: str, project_key: str, issue_data: dict) -> dict:
-    """Create a Jira issue."""
-    url = f"{jira_url}/rest/api/3/issue"
-
-    payload = {
-        "fields": {
-            "project": {"key": project_key},
-            "summary": issue_data["summary"],
-            "description": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": issue_data["description"]
-                            }
-                        ]
-                    }
-                ]
-            },
-            "issuetype": {"name": issue_data.get("issuetype", "Task")}
-        }
+    return "Basic " + base64.b64encode(f"{email}:{api_token}".encode()).decode("ascii")
+
+
+_connections = threading.local()
+
+
+def _get_connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to the Jira host."""
+    pool = _connections.__dict__.setdefault("pool", {})
+    conn = pool.get((scheme, netloc))
+    if conn is None:
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = pool[(scheme, netloc)] = conn_cls(netloc, timeout=REQUEST_TIMEOUT_SECONDS)
+    return conn
+
+
+def send_request(url: str, auth_header: str, method: str = "GET", body: bytes = None) -> http.client.HTTPResponse:
+    """Send a request over a reused connection. The caller must read the whole response."""
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    headers = {**(_GET_HEADERS if body is None else _POST_HEADERS), "Authorization": auth_header}
+
+    conn = _get_connection(parts.scheme, parts.netloc)
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if method != "GET":
+            # Jira may have processed the request before dropping the connection,
+            # so resending is left to the caller, which checks for created issues first
+            raise
+    except BaseException:
+        # A failed request leaves http.client mid-request; reset it so this thread can send again
+        conn.close()
+        raise
+
+    # Jira closed the idle keep-alive connection; reconnect and try once more
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _is_json(response: http.client.HTTPResponse) -> bool:
+    """Check if the response body is JSON rather than, say, an HTML error page."""
+    return (response.getheader("Content-Type") or "").startswith("application/json")
+
+
+def _read_error(url: str, response: http.client.HTTPResponse) -> str:
+    """Read the start of an error body, dropping the connection if the rest is left unread."""
+    body = response.read(MAX_ERROR_BYTES)
+    # A shorter read reached the end; chunked bodies only report closed once the last chunk is read
+    if len(body) == MAX_ERROR_BYTES and response.read(1):
+        # Unread bytes would corrupt the next response on this keep-alive connection
+        parts = urlsplit(url)
+        _connections.pool.pop((parts.scheme, parts.netloc)).close()
+    return body.decode(errors="replace")
+
+
+_pace_lock = threading.Lock()
+_pace = {"interval": 0.0, "next_allowed": 0.0}
+
+
+def _wait_for_slot():
+    """Block until the shared rate limiter lets this thread send a request."""
+    with _pace_lock:
+        now = time.monotonic()
+        start = max(now, _pace["next_allowed"])
+        _pace["next_allowed"] = start + _pace["interval"]
+    time.sleep(start - now)
+
+
+def _update_pace(headers):
+    """Derive the delay between requests from Jira's rate limit headers."""
+    interval = headers.get("X-RateLimit-Interval-Seconds")
+    fill_rate = headers.get("X-RateLimit-FillRate")
+    try:
+        seconds_per_request = float(interval) / float(fill_rate)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return
+    with _pace_lock:
+        _pace["interval"] = seconds_per_request
+
+
+def _is_retryable(status: int) -> bool:
+    """Check if Jira asked us to slow down or failed on its side."""
+    return status == 429 or status >= 500
+
+
+def _retry_delay(attempt: int, response: http.client.HTTPResponse = None) -> float:
+    """Seconds to wait before retrying, preferring Jira's Retry-After header."""
+    retry_after = response.getheader("Retry-After") if response else None
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return min(2 ** attempt, MAX_BACKOFF_SECONDS)
+
+
+def send_paced(url: str, auth_header: str, method: str = "GET", body: bytes = None) -> http.client.HTTPResponse:
+    """Send a single request once the shared rate limiter allows it."""
+    _wait_for_slot()
+    response = send_request(url, auth_header, method, body)
+    _update_pace(response.headers)
+    return response
+
+
+def send_with_backoff(url: str, auth_header: str, method: str = "GET", body: bytes = None) -> http.client.HTTPResponse:
+    """Send a paced request, retrying on 429 and 5xx responses."""
+    for attempt in range(MAX_ATTEMPTS):
+        response = send_paced(url, auth_header, method, body)
+        if not _is_retryable(response.status) or attempt == MAX_ATTEMPTS - 1:
+            return response
+
+        _read_error(url, response)
+        time.sleep(_retry_delay(attempt, response))
+
+
+def idempotency_label(issue_data: dict) -> str:
+    """Label derived from the summary, used to find issues an earlier attempt already created."""
+    digest = hashlib.sha1(issue_data["summary"].encode()).hexdigest()[:12]
+    return f"idem-{digest}"
+
+
+def _format_description(text: str, api_version: int):
+    """Format a description for the REST API version: plain text for v2, ADF for v3."""
+    if api_version == 2:
+        return text
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}]
+            }
+        ]
+    }
+
+
+def build_issue_fields(project_key: str, issue_data: dict, api_version: int = 3) -> dict:
+    """Build the fields object for a new issue."""
+    return {
+        "project": {"key": project_key},
+        "summary": issue_data["summary"],
+        "description": _format_description(issue_data["description"], api_version),
+        "issuetype": {"name": issue_data.get("issuetype", "Task")},
+        "labels": [*issue_data.get("labels", []), idempotency_label(issue_data)]
+    }
+
+
+class SearchRetryableError(Exception):
+    """Jira answered an issue search with 429 or 5xx; the response carries any Retry-After."""
+
+    def __init__(self, message: str, response: http.client.HTTPResponse):
+        super().__init__(message)
+        self.response = response
+
+
+def find_existing_issues(jira_url: str, auth_header: str, project_key: str, labels: list,
+                         api_version: int = 3) -> dict:
+    """Map idempotency labels to results for issues that already exist in the project.
+
+    Each page is requested once. A 429 or 5xx raises SearchRetryableError so the
+    retry counts against the caller's attempts instead of nesting a second loop.
+    """
+    quoted = ", ".join(f'"{label}"' for label in labels)
+    params = {
+        "jql": f'project = "{project_key}" AND labels in ({quoted})',
+        "fields": "labels",
+        "maxResults": 100
     }
 
-    # Add labels if provided
-    if "labels" in issue_data:
-        payload["fields"]["labels"] = issue_data["labels"]
-
-    data = json.dumps(payload).encode("utf-8")
-
-    req = request.Request(
-        url,
-        data=data,
-        headers={
-            "Authorization": auth_header,
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        },
-        method="POST"
+    existing = {}
+    while True:
+        url = f"{jira_url}/rest/api/{api_version}/search/jql?{urlencode(params)}"
+        with send_paced(url, auth_header) as response:
+            if _is_retryable(response.status):
+                raise SearchRetryableError(f"Issue search failed: {response.status}: {_read_error(url, response)}", response)
+            if response.status >= 400:
+                raise RuntimeError(f"Issue search failed: {response.status}: {_read_error(url, response)}")
+            found = _load(response)
+
+        for issue in found.get("issues", []):
+            for label in set(labels).intersection(issue["fields"].get("labels", [])):
+                existing.setdefault(label, {"success": True, "key": issue["key"], "id": issue["id"], "existing": True})
+
+        # Duplicates from older runs can push matches past the first page
+        if not found.get("nextPageToken"):
+            return existing
+        params["nextPageToken"] = found["nextPageToken"]
+
+
+def _parse_bulk_response(status: int, result: dict, count: int) -> list:
+    """Turn a parsed bulk create response into one result per submitted issue."""
+    # Per-issue failures come back as a list; anything else failed the whole request
+    if not isinstance(result.get("errors"), list):
+        return [{"success": False, "error": f"{status}: {_dumps(result).decode()}"}] * count
+
+    failures = {failure["failedElementNumber"]: failure for failure in result["errors"]}
+    created = iter(result.get("issues", []))
+
+    results = []
+    for index in range(count):
+        if index in failures:
+            failure = failures[index]
+            element_errors = _dumps(failure.get("elementErrors", {})).decode()
+            results.append({"success": False, "error": f"{failure.get('status')}: {element_errors}"})
+            continue
+        # Created issues are listed in request order, skipping the failed elements
+        issue = next(created, None)
+        if issue is None:
+            results.append({"success": False, "error": "Missing from bulk response"})
+        else:
+            results.append({"success": True, "key": issue["key"], "id": issue["id"]})
+    return results
+
+
+def create_issues_bulk(jira_url: str, auth_header: str, project_key: str, issues: list,
+                       api_version: int = 3) -> list:
+    """Create up to BULK_LIMIT issues in one request, returning results in input order.
+
+    A timed out or failed POST may still have created some issues, so before
+    every attempt issues already carrying their idempotency label are looked
+    up and reused instead of being posted again.
+    """
+    url = f"{jira_url}/rest/api/{api_version}/issue/bulk"
+    labels = [idempotency_label(issue) for issue in issues]
+    results = [None] * len(issues)
+
+    # Errors to report for issues still unresolved once the attempts run out
+    failures = {}
+
+    for attempt in range(MAX_ATTEMPTS):
+        pending = [i for i, result in enumerate(results) if result is None]
+        try:
+            existing = find_existing_issues(jira_url, auth_header, project_key, [labels[i] for i in pending], api_version)
+        except RuntimeError as e:
+            # Jira rejected the search itself; trying again won't help
+            failures = {i: {"success": False, "error": str(e)} for i in pending}
+            break
+        except SearchRetryableError as e:
+            failures = {i: {"success": False, "error": str(e)} for i in pending}
+            if attempt < MAX_ATTEMPTS - 1:
+                time.sleep(_retry_delay(attempt, e.response))
+            continue
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            failures = {i: {"success": False, "error": f"Issue search failed: {e}"} for i in pending}
+            if attempt < MAX_ATTEMPTS - 1:
+                time.sleep(_retry_delay(attempt))
+            continue
+
+        for i in pending:
+            results[i] = existing.get(labels[i])
+        pending = [i for i in pending if results[i] is None]
+        if not pending:
+            break
+
+        data = _dumps({"issueUpdates": [{"fields": build_issue_fields(project_key, issues[i], api_version)} for i in pending]})
+        try:
+            with send_paced(url, auth_header, "POST", data) as response:
+                if _is_json(response):
+                    pending_results = _parse_bulk_response(response.status, _load(response), len(pending))
+                else:
+                    error_text = f"{response.status}: {_read_error(url, response)}"
+                    pending_results = [{"success": False, "error": error_text}] * len(pending)
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            pending_results = [{"success": False, "error": str(e)}] * len(pending)
+            delay = _retry_delay(attempt)
+        else:
+            delay = _retry_delay(attempt, response) if _is_retryable(response.status) else None
+
+        if delay is None:
+            for i, result in zip(pending, pending_results):
+                results[i] = result
+            break
+        failures = dict(zip(pending, pending_results))
+        if attempt < MAX_ATTEMPTS - 1:
+            time.sleep(delay)
+
+    return [result or failures[i] for i, result in enumerate(results)]
+
+
+def check_project_exists(jira_url: str, auth_header: str, project_key: str, api_version: int = 3) -> bool:
+    """Check if the project exists and is accessible."""
+    url = f"{jira_url}/rest/api/{api_version}/project/{project_key}"
+
+    with send_with_backoff(url, auth_header) as response:
+        response.read()
+        return response.status < 400
+
+
+def is_project_check_cached(jira_url: str, project_key: str, jira_email: str) -> bool:
+    """Check if this account verified the project within PROJECT_CHECK_TTL_SECONDS."""
+    try:
+        entry = json.loads(PROJECT_CHECK_CACHE.read_text())
+    except (OSError, ValueError):
+        return False
+
+    return (
+        entry.get("url") == jira_url
+        and entry.get("key") == project_key
+        and entry.get("email") == jira_email
+        and time.time() - entry.get("verified_at", 0) < PROJECT_CHECK_TTL_SECONDS
     )
 
+
+def cache_project_check(jira_url: str, project_key: str, jira_email: str):
+    """Record a successful project check so later runs by the same account can skip it."""
+    entry = {"key": project_key, "url": jira_url, "email": jira_email, "verified_at": time.time()}
     try:
-        with request.urlopen(req) as response:
-            result = json.loads(response.read().decode())
-            return {"success": True, "key": result["key"], "id": result["id"]}
-    except error.HTTPError as e:
-        error_body = e.read().decode()
-        return {"success": False, "error": f"{e.code}: {error_body}"}
-    except error.URLError as e:
-        return {"success": False, "error": str(e.reason)}
+        PROJECT_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so a concurrent run never reads half a file
+        tmp_path = PROJECT_CHECK_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entry))
+        os.replace(tmp_path, PROJECT_CHECK_CACHE)
+    except OSError:
+        pass  # The cache is only an optimization
+
+
+def _batches(items: list, size: int):
+    """Yield successive lists of at most size items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def create_issues(jira_url: str, auth_header: str, project_key: str, issues: list, api_version: int = 3):
+    """Create issues in concurrent bulk requests, yielding (issue, result) pairs as each batch finishes."""
+    batches = list(_batches(issues, BULK_LIMIT))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONCURRENCY, len(batches)))) as executor:
+        futures = {
+            executor.submit(create_issues_bulk, jira_url, auth_header, project_key, batch, api_version): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                batch_results = future.result()
+            except Exception as e:
+                batch_results = [{"success": False, "error": repr(e)}] * len(batch)
+            yield from zip(batch, batch_results)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Create Jira issues for Beyond Burndown E2E testing tasks.")
+    parser.add_argument(
+        "--api-version",
+        type=int,
+        choices=[2, 3],
+        default=3,
+        help="Jira REST API version: 3 sends ADF descriptions, 2 sends plain text (default: 3)"
+    )
+    return parser.parse_args()
 
 
 def main():
     """Main function to create all issues."""
+    args = parse_args()
+
     # Get configuration from environment
     jira_url = os.environ.get("JIRA_URL")
     jira_email = os.environ.get("JIRA_EMAIL")
@@ -260,14 +454,30 @@ def main():
         missing.append("JIRA_API_TOKEN")
 
     if missing:
-        print("Error: Missing required environment variables:")
+        print("=" * 60)
+        print("ERROR: Missing required environment variables")
+        print("=" * 60)
         for var in missing:
             print(f"  - {var}")
-        print("\nSet them using:")
+        print()
+        print("Set them using (bash):")
         print('  export JIRA_URL="https://yoursite.atlassian.net"')
         print('  export JIRA_EMAIL="your.email@example.com"')
         print('  export JIRA_API_TOKEN="your-api-token"')
-        print("\nGet your API token at: https://id.atlassian.com/manage-profile/security/api-tokens")
+        print()
+        print("Or using (Windows CMD):")
+        print('  set JIRA_URL=https://yoursite.atlassian.net')
+        print('  set JIRA_EMAIL=your.email@example.com')
+        print('  set JIRA_API_TOKEN=your-api-token')
+        print()
+        print("Or using (PowerShell):")
+        print('  $env:JIRA_URL="https://yoursite.atlassian.net"')
+        print('  $env:JIRA_EMAIL="your.email@example.com"')
+        print('  $env:JIRA_API_TOKEN="your-api-token"')
+        print()
+        print("Get your API token at:")
+        print("  https://id.atlassian.com/manage-profile/security/api-tokens")
+        print("=" * 60)
         sys.exit(1)
 
     # Remove trailing slash from URL if present
@@ -275,38 +485,97 @@ def main():
 
     # Create auth header
     auth_header = get_auth_header(jira_email, jira_api_token)
-
-    print(f"Creating {len(ISSUES)} issues in project {PROJECT_KEY}...")
-    print(f"Jira URL: {jira_url}")
-    print("-" * 50)
-
-    created = []
-    failed = []
-
-    for issue in ISSUES:
-        print(f"\nCreating: {issue['summary'][:50]}...")
-        result = create_issue(jira_url, auth_header, PROJECT_KEY, issue)
+    issues = load_issues()
+
+    print("=" * 60)
+    print("Beyond Burndown - Jira Issue Creator")
+    print("=" * 60)
+    print(f"Jira URL: {jira_url} (REST API v{args.api_version})")
+    print(f"Project:  {PROJECT_KEY}")
+    print(f"Issues:   {len(issues)}")
+    print("-" * 60)
+
+    # Check project exists, in the background so issue creation can start right away
+    print(f"\nChecking project {PROJECT_KEY}...")
+    project_check = None
+    if is_project_check_cached(jira_url, PROJECT_KEY, jira_email):
+        print(f"  ✓ Project {PROJECT_KEY} found (cached)")
+    else:
+        preflight = ThreadPoolExecutor(max_workers=1)
+        project_check = preflight.submit(check_project_exists, jira_url, auth_header, PROJECT_KEY, args.api_version)
+        preflight.shutdown(wait=False)
+        print("  Running alongside issue creation")
+
+    print("\nCreating issues...")
+    print("-" * 60)
+
+    # Only counts and the most recent failures are kept; each result is printed as it arrives
+    counters = {"created": 0, "existing": 0, "fail": 0}
+    last_failed = deque(maxlen=MAX_FAILURES_SHOWN)
+
+    results = create_issues(jira_url, auth_header, PROJECT_KEY, issues, args.api_version)
+
+    for i, (issue, result) in enumerate(results, 1):
+        summary_short = issue['summary'][:45] + "..." if len(issue['summary']) > 45 else issue['summary']
+        print(f"\n[{i}/{len(issues)}] {summary_short}")
 
         if result["success"]:
-            print(f"  ✓ Created: {result['key']}")
-            print(f"    URL: {jira_url}/browse/{result['key']}")
-            created.append(result["key"])
+            if result.get("existing"):
+                print(f"  ✓ Already exists: {result['key']}")
+                counters["existing"] += 1
+            else:
+                print(f"  ✓ Created: {result['key']}")
+                counters["created"] += 1
+            print(f"    {jira_url}/browse/{result['key']}")
+        else:
+            print(f"  ✗ Failed: {result['error'][:100]}")
+            counters["fail"] += 1
+            last_failed.append(issue["summary"])
+
+    project_found = True
+    if project_check is not None:
+        try:
+            project_found = project_check.result()
+        except (OSError, http.client.HTTPException) as e:
+            print(f"\nERROR: Could not check project {PROJECT_KEY}: {e}")
+            project_found = False
+        if project_found:
+            cache_project_check(jira_url, PROJECT_KEY, jira_email)
+            print(f"\n✓ Project {PROJECT_KEY} found")
+        else:
+            print(f"\nERROR: Project '{PROJECT_KEY}' not found or not accessible.")
+            print("Check that:")
+            print("  1. The project key is correct")
+            print("  2. Your API token has access to this project")
+            print("  3. Your Jira URL is correct")
+            print("Any issues listed as created above need to be deleted by hand.")
+
+    summary = [
+        "",
+        "=" * 60,
+        "SUMMARY",
+        "=" * 60,
+        f"Created:  {counters['created']}",
+        f"Existing: {counters['existing']}",
+        f"Failed:   {counters['fail']}"
+    ]
+
+    if last_failed:
+        if counters["fail"] > len(last_failed):
+            summary += ["", f"✗ Failed Issues (last {len(last_failed)}):"]
         else:
-            print(f"  ✗ Failed: {result['error']}")
-            failed.append(issue["summary"])
+            summary += ["", "✗ Failed Issues:"]
+        summary += [f"  - {summary_text}" for summary_text in last_failed]
 
-    print("\n" + "=" * 50)
-    print(f"Summary: {len(created)} created, {len(failed)} failed")
+    succeeded = not counters["fail"] and project_found
+    if succeeded:
+        summary += ["", "=" * 60, "Done!"]
 
-    if created:
-        print(f"\nCreated issues:")
-        for key in created:
-            print(f"  - {jira_url}/browse/{key}")
+    # Write the summary block in one call rather than one write per line
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
 
-    if failed:
-        print(f"\nFailed issues:")
-        for summary in failed:
-            print(f"  - {summary}")
+    if not succeeded:
         sys.exit(1)
 
 
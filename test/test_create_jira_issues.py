@@ -0,0 +1,148 @@
+"""Regression tests for the retry logic in scripts/create_jira_issues.py.
+
+Run with: python -m unittest discover -s test
+"""
+
+import re
+import sys
+import json
+import time
+import threading
+import unittest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import create_jira_issues  # noqa: E402
+
+STALL_SECONDS = 1.0
+CLIENT_TIMEOUT_SECONDS = 0.2
+
+
+class FakeJira(BaseHTTPRequestHandler):
+    """Just enough of Jira's search and bulk create endpoints for the retry path."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except OSError:
+            # The client gave up on a stalled request and closed the connection
+            self.close_connection = True
+
+    def do_GET(self):
+        state = self.server.state
+        query = parse_qs(urlsplit(self.path).query)
+        labels = set(re.findall(r'"(idem-[0-9a-f]+)"', query["jql"][0]))
+        with state["lock"]:
+            state["searches"] += 1
+            if state["searches_throttled"] > 0:
+                state["searches_throttled"] -= 1
+                return self._send_json(429, {"errorMessages": ["Rate limit exceeded"]})
+            found = [
+                {"id": key.split("-")[1], "key": key, "fields": {"labels": fields["labels"]}}
+                for key, fields in state["issues"].items() if labels.intersection(fields["labels"])
+            ]
+        self._send_json(200, {"issues": found})
+
+    def do_POST(self):
+        state = self.server.state
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with state["lock"]:
+            state["posts"] += 1
+            stall = state["posts_stalled"] > 0
+            if stall:
+                state["posts_stalled"] -= 1
+            created = []
+            if not stall or state["create_before_stall"]:
+                for update in body["issueUpdates"]:
+                    key = f"BB-{len(state['issues']) + 1}"
+                    state["issues"][key] = update["fields"]
+                    created.append({"id": key.split("-")[1], "key": key})
+        if stall:
+            time.sleep(STALL_SECONDS)
+        self._send_json(201, {"issues": created, "errors": []})
+
+
+class CreateIssuesBulkRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeJira)
+        self.server.daemon_threads = True
+        self.server.state = {
+            "lock": threading.Lock(),
+            "issues": {},
+            "posts": 0,
+            "searches": 0,
+            "posts_stalled": 0,
+            "searches_throttled": 0,
+            "create_before_stall": False,
+        }
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.jira_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.issues = [{"summary": f"Issue {n}", "description": "", "type": "Task"} for n in range(3)]
+
+        # Fresh connections with a short timeout, and no real backoff between attempts
+        self.close_connections()
+        self.addCleanup(self.close_connections)
+        for name, value in (("REQUEST_TIMEOUT_SECONDS", CLIENT_TIMEOUT_SECONDS), ("_retry_delay", lambda *args: 0)):
+            patcher = mock.patch.object(create_jira_issues, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def close_connections():
+        for conn in create_jira_issues._connections.__dict__.pop("pool", {}).values():
+            conn.close()
+
+    def create(self) -> list:
+        return create_jira_issues.create_issues_bulk(self.jira_url, "Basic x", "BB", self.issues)
+
+    def summaries(self) -> list:
+        return sorted(fields["summary"] for fields in self.server.state["issues"].values())
+
+    def test_timed_out_post_that_created_issues_is_not_reposted(self):
+        self.server.state.update(posts_stalled=1, create_before_stall=True)
+
+        results = self.create()
+
+        self.assertTrue(all(result["success"] for result in results), results)
+        self.assertTrue(all(result.get("existing") for result in results), results)
+        self.assertEqual(self.server.state["posts"], 1)
+        self.assertEqual(self.summaries(), sorted(issue["summary"] for issue in self.issues))
+
+    def test_timed_out_post_that_created_nothing_is_reposted(self):
+        self.server.state.update(posts_stalled=1, create_before_stall=False)
+
+        results = self.create()
+
+        self.assertTrue(all(result["success"] for result in results), results)
+        self.assertEqual(self.server.state["posts"], 2)
+        self.assertEqual(self.summaries(), sorted(issue["summary"] for issue in self.issues))
+
+    def test_throttled_searches_share_the_bulk_attempts(self):
+        self.server.state.update(searches_throttled=create_jira_issues.MAX_ATTEMPTS)
+
+        results = self.create()
+
+        self.assertTrue(all(not result["success"] and "429" in result["error"] for result in results), results)
+        self.assertEqual(self.server.state["searches"], create_jira_issues.MAX_ATTEMPTS)
+        self.assertEqual(self.server.state["posts"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()